@@ -1,23 +1,25 @@
 import requests
-import json
 import time
 import auth
 
+# The Zoominfo enrich endpoint accepts up to 25 match inputs per request.
+BATCH_SIZE = 25
 
-def get_new_contact_data(entry, jwt_token):
+
+def get_new_contact_data(entries, jwt_token):
     """
     Enriches contact data using the Zoominfo API.
 
-    Constructs a request to the Zoominfo API using contact entry,
+    Constructs a single request to the Zoominfo API using the person IDs of a batch of contact entries,
     and attempts to enrich the provided contact information. The function handles API response
-    and returns enriched data if successful, or None if there's an error.
+    and returns the enriched data of each entry, or None for entries where there was an error.
 
     Args:
-        entry (dict): A dictionary containing contact information.
+        entries (list): A list of dictionaries containing contact information.
         jwt_token (str): A JWT token for authentication with the Zoominfo API.
 
     Returns:
-        dict or None: A dictionary containing enriched contact information, or None if there was an error.
+        list: One enriched result per entry in the same order, with None for entries that could not be enriched.
     """
 
     url = "https://api.zoominfo.com/enrich/contact"
@@ -27,23 +29,38 @@ def get_new_contact_data(entry, jwt_token):
         "Authorization": f"Bearer {jwt_token}",
     }
 
-    match_person_input = {"personId": entry["personId"]}
+    match_person_input = [{"personId": entry["personId"]} for entry in entries]
 
     payload = {
-        "matchPersonInput": [match_person_input],
+        "matchPersonInput": match_person_input,
         "outputFields": ["firstName", "lastName", "email", "phone", "jobTitle"],
     }
 
     response = requests.post(url, headers=headers, json=payload)
 
+    # A single malformed input rejects the whole batch with a 400, so the
+    # records are retried one at a time and only the bad ones are marked failed.
+    if response.status_code == 400 and len(entries) > 1:
+        return [
+            result
+            for entry in entries
+            for result in get_new_contact_data([entry], jwt_token)
+        ]
+
     if response.status_code != 200:  # 200 is the HTTP status code for 'OK'
         print(f"Error: Received status code {response.status_code}")
         print(response.text)
-        entry["enrichmentStatus"] = "Failed"
-        entry["errorMessage"] = response.text
-        return None
+        for entry in entries:
+            entry["enrichmentStatus"] = "Failed"
+            entry["errorMessage"] = response.text
+        return [None] * len(entries)
+
+    response_data = response.json()
 
-    return response.json()
+    if not response_data.get("success"):
+        return [None] * len(entries)
+
+    return response_data["data"]["result"]
 
 
 def update_new_contact_data(entry, new_data_item):
@@ -74,12 +91,12 @@ def update_new_contact_data(entry, new_data_item):
     return entry
 
 
-def add_new_contact(input_filename, jwt_token, last_auth_time, username, password):
+def add_new_contact(entries, jwt_token, last_auth_time, username, password):
     """
-    Adds new contact data to the existing data in the input file.
+    Adds new contact data to a batch of entries in place.
 
     Args:
-        input_filename (str): The path to the input file.
+        entries (list): The entries to update.
         jwt_token (str): The JWT token for authentication.
         last_auth_time (float): The timestamp of the last authentication.
         username (str): The username for authentication.
@@ -89,36 +106,27 @@ def add_new_contact(input_filename, jwt_token, last_auth_time, username, passwor
         tuple: A tuple containing the updated JWT token and last authentication time.
     """
 
-    with open(input_filename, "r", encoding="utf-8") as file:
-        old_data = json.load(file)
-
-    merged_data = []
-    processed_records = 0
+    pending = [
+        entry
+        for entry in entries
+        if entry.get("needsContact") == "Yes" and entry.get("personId")
+    ]
 
-    for entry in old_data:
+    for start in range(0, len(pending), BATCH_SIZE):
+        batch = pending[start : start + BATCH_SIZE]
 
         if time.time() - last_auth_time >= 55 * 60:
             jwt_token = auth.authenticate(username, password)
             last_auth_time = time.time()
 
-        try:
-            if entry.get("needsContact") == "Yes" and entry.get("personId"):
-                new_data = get_new_contact_data(entry, jwt_token)
-                if new_data and new_data.get("success"):
-                    entry = update_new_contact_data(
-                        entry, new_data["data"]["result"][0]
-                    )
-                    processed_records += 1
-                    print(
-                        f"\rContacts updated: {processed_records}", end="", flush=True
-                    )
-
-        except IndexError as e:
-            print(f"Error processing record: {entry}. Error: {e}")
-
-        merged_data.append(entry)
-
-    with open(input_filename, "w", encoding="utf-8") as file:
-        json.dump(merged_data, file, indent=4, ensure_ascii=False)
+        results = get_new_contact_data(batch, jwt_token)
+        for entry, result in zip(batch, results):
+            if not result:
+                continue
+            try:
+                update_new_contact_data(entry, result)
+
+            except IndexError as e:
+                print(f"Error processing record: {entry}. Error: {e}")
 
     return jwt_token, last_auth_time
@@ -1,5 +1,4 @@
 import requests
-import json
 import time
 import auth
 
@@ -133,12 +132,12 @@ def update_company_data(entry, new_data_item):
     return entry
 
 
-def company_enrich(input_filename, jwt_token, last_auth_time, username, password):
+def company_enrich(entries, jwt_token, last_auth_time, username, password):
     """
-    Enriches company data in the input file using the provided JWT token and authentication credentials.
+    Enriches the company data of a batch of entries in place using the provided JWT token and authentication credentials.
 
     Args:
-        input_filename (str): The path to the input file containing the company data.
+        entries (list): The entries containing the company data.
         jwt_token (str): The JWT token for authentication.
         last_auth_time (float): The timestamp of the last authentication.
         username (str): The username for authentication.
@@ -148,13 +147,7 @@ def company_enrich(input_filename, jwt_token, last_auth_time, username, password
         tuple: A tuple containing the updated JWT token and the timestamp of the last authentication.
     """
 
-    with open(input_filename, "r", encoding="utf-8") as file:
-        old_data = json.load(file)
-
-    merged_data = []
-    companies_processed = 0
-
-    for entry in old_data:
+    for entry in entries:
 
         if time.time() - last_auth_time >= 55 * 60:
             jwt_token = auth.authenticate(username, password)
@@ -176,14 +169,6 @@ def company_enrich(input_filename, jwt_token, last_auth_time, username, password
                 entry["company_match_criteria"] = "Non-strict"
 
         if new_data and new_data.get("success") and new_data["data"].get("result"):
-            entry = update_company_data(entry, new_data)
-
-        merged_data.append(entry)
-
-        companies_processed += 1
-        print(f"\rCompanies processed: {companies_processed}", end="", flush=True)
-
-    with open(input_filename, "w", encoding="utf-8") as file:
-        json.dump(merged_data, file, indent=4, ensure_ascii=False)
+            update_company_data(entry, new_data)
 
     return jwt_token, last_auth_time
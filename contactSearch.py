@@ -68,12 +68,12 @@ def get_contact_person_id(entry, jwt_token, strict, use_location_id):
         return None
 
 
-def contact_search(input_filename, jwt_token, last_auth_time, username, password):
+def contact_search(entries, jwt_token, last_auth_time, username, password):
     """
-    Search for contacts in the given input file and enrich the data with contact information.
+    Search for contacts for a batch of entries and enrich them in place with contact information.
 
     Parameters:
-    input_filename (str): The path to the input file containing the data to be processed.
+    entries (list): The entries to be processed.
     jwt_token (str): The JWT token for authentication.
     last_auth_time (float): The timestamp of the last authentication.
     username (str): The username for authentication.
@@ -83,13 +83,7 @@ def contact_search(input_filename, jwt_token, last_auth_time, username, password
     tuple: A tuple containing the updated JWT token and last authentication time.
     """
 
-    with open(input_filename, "r", encoding="utf-8") as file:
-        data = json.load(file)
-
-    processed_records = 0
-    person_id_count = 0
-
-    for entry in data:
+    for entry in entries:
         if time.time() - last_auth_time >= 55 * 60:
             jwt_token = auth.authenticate(username, password)
             last_auth_time = time.time()
@@ -104,7 +98,6 @@ def contact_search(input_filename, jwt_token, last_auth_time, username, password
                 if person_id:
                     entry["personId"] = person_id
                     entry["contactMatchCriteria"] = "locationId_strict"
-                    person_id_count += 1
                 else:
                     person_id = get_contact_person_id(
                         entry, jwt_token, strict=False, use_location_id=True
@@ -112,7 +105,6 @@ def contact_search(input_filename, jwt_token, last_auth_time, username, password
                     if person_id:
                         entry["personId"] = person_id
                         entry["contactMatchCriteria"] = "locationId_loose"
-                        person_id_count += 1
 
             if person_id is None and entry.get("zi_c_company_id"):
                 person_id = get_contact_person_id(
@@ -121,7 +113,6 @@ def contact_search(input_filename, jwt_token, last_auth_time, username, password
                 if person_id:
                     entry["personId"] = person_id
                     entry["contactMatchCriteria"] = "companyId_strict"
-                    person_id_count += 1
                 else:
                     person_id = get_contact_person_id(
                         entry, jwt_token, strict=False, use_location_id=False
@@ -129,16 +120,7 @@ def contact_search(input_filename, jwt_token, last_auth_time, username, password
                     if person_id:
                         entry["personId"] = person_id
                         entry["contactMatchCriteria"] = "companyId_loose"
-                        person_id_count += 1
 
             entry["newContactFound"] = "Yes" if person_id else "No"
 
-            processed_records += 1
-            print(f"\rProcessed records: {processed_records}", end="", flush=True)
-
-    print(f"\nTotal contact's found: {person_id_count}")
-
-    with open(input_filename, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4, ensure_ascii=False)
-
     return jwt_token, last_auth_time
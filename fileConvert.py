@@ -1,11 +1,63 @@
 import csv
-import json
+import io
+import mmap
 import os
+import orjson
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+
+# Enrichment fields added to every record by load_json and filled in by the later stages.
+_DEFAULTS = MappingProxyType(
+    {
+        "zi_c_name": "",
+        "zi_c_company_id": "",
+        "zi_c_company_name": "",
+        "jobTitle": "",
+        "zi_c_phone": "",
+        "zi_c_url": "",
+        "zi_c_linkedin_url": "",
+        "zi_c_naics6": "",
+        "sectorTitle": "",
+        "primaryIndustry": "",
+        "zi_c_employees": "",
+        "zi_c_street": "",
+        "zi_c_city": "",
+        "zi_c_state": "",
+        "zi_c_zip": "",
+        "zi_c_country": "",
+        "zi_c_location_id": "",
+        "needsContact": "",
+        "newContactFound": "",
+        "personId": "",
+        "contactMatchCriteria": "",
+        "enrichmentStatus": "Success",
+        "errorMessage": "",
+    }
+)
+
+# Large buffers keep the number of read/write calls down on big files.
+_BUFFER_SIZE = 1 << 20
+
+# Output files are written in pieces of this size.
+_WRITE_BUFFER_SIZE = 4 << 20
+
+# os.open translates line endings on Windows unless the file is opened as binary.
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Files of roughly 100,000 template rows or more are converted in parallel.
+_PARALLEL_MIN_SIZE = 32 << 20
+
+# Largest block handed to a worker when converting in parallel.
+_PARALLEL_BLOCK_SIZE = 16 << 20
 
 
 def csv_to_json(input_csv_filename):
     """
-    Convert a CSV file to a JSON file with specific field mappings and additional fields.
+    Convert a CSV file to a JSON file with specific field mappings.
+    The additional enrichment fields all start with their default values, so they are
+    not written and are added back by load_json.
 
     Args:
     input_csv_filename (str): The path to the input CSV file.
@@ -30,53 +82,253 @@ def csv_to_json(input_csv_filename):
         "Additional Contact Info": "additionalContactInfo",
     }
 
-    new_json_values = {
-        "zi_c_name": "",
-        "zi_c_company_id": "",
-        "zi_c_company_name": "",
-        "jobTitle": "",
-        "zi_c_phone": "",
-        "zi_c_url": "",
-        "zi_c_linkedin_url": "",
-        "zi_c_naics6": "",
-        "sectorTitle": "",
-        "primaryIndustry": "",
-        "zi_c_employees": "",
-        "zi_c_street": "",
-        "zi_c_city": "",
-        "zi_c_state": "",
-        "zi_c_zip": "",
-        "zi_c_country": "",
-        "zi_c_location_id": "",
-        "needsContact": "",
-        "newContactFound": "",
-        "personId": "",
-        "contactMatchCriteria": "",
-        "enrichmentStatus": "Success",
-        "errorMessage": "",
-    }
+    base_filename, _ = os.path.splitext(input_csv_filename)
+    output_json_filename = base_filename + ".json"
+
+    # Rows are written to the JSON array as they are read so that only one
+    # record is held in memory at a time.
+    with open(
+        input_csv_filename, "r", encoding="utf-8-sig", buffering=_BUFFER_SIZE
+    ) as csv_file, open(
+        output_json_filename, "wb", buffering=_BUFFER_SIZE
+    ) as json_file:
+        csv_reader = csv.reader(csv_file)
+        header = next(csv_reader, [])
+
+        # Translate the header once rather than remapping every row's keys.
+        out_keys = [header_mapping.get(key, key) for key in header]
+
+        workers = os.cpu_count() or 1
+        file_size = os.path.getsize(input_csv_filename)
+        bounds = None
+        if workers > 1 and file_size >= _PARALLEL_MIN_SIZE:
+            # The same number of blocks for every worker, with as many rounds
+            # as it takes to keep each block under the block size.
+            rounds = -(-file_size // (_PARALLEL_BLOCK_SIZE * workers))
+            block_count = workers * rounds
+            bounds = _block_bounds(input_csv_filename, file_size, block_count)
+
+        if bounds:
+            fragments = _convert_parallel(input_csv_filename, bounds, out_keys, workers)
+        else:
+            fragments = _encode_records(csv_reader, out_keys)
+
+        # The file is only read back by the tool, so records are written
+        # compactly, one per line, rather than pretty-printed.
+        json_file.write(b"[\n")
+
+        first = True
+        for fragment in fragments:
+            if not fragment:
+                continue
+            if not first:
+                json_file.write(b",\n")
+            json_file.write(fragment)
+            first = False
+
+        json_file.write(b"\n]")
+
+
+def _is_blank_row(row):
+    """
+    Checks whether a CSV row has no content, i.e. every field is empty or whitespace.
+
+    Args:
+    row (list): The fields of the row.
+
+    Returns:
+    bool: True if the row is skipped by the conversion.
+    """
+    return not any(field and not field.isspace() for field in row)
+
+
+def _encode_records(rows, out_keys):
+    """
+    Maps CSV rows onto JSON records and yields each one encoded.
+    Rows shorter than the header are padded with empty strings. Empty fields beyond
+    the header are dropped, and any that remain are joined with commas onto the
+    last column.
+
+    Args:
+    rows (iterable): The CSV rows, without the header.
+    out_keys (list): The JSON key for each CSV column.
+
+    Returns:
+    generator: The encoded JSON record for every non-blank row.
+    """
+    # Each record is encoded before the next row is read, so one dict is
+    # refilled for every row instead of allocating a new one per record. The
+    # default enrichment fields are left out and restored by load_json.
+    mapped_row = dict.fromkeys(out_keys, "")
+    width = len(out_keys)
+
+    for row in rows:
+
+        if _is_blank_row(row):
+            continue
+
+        # Short rows are padded so every record carries the full header, and
+        # no value is left over from the previous row.
+        if len(row) < width:
+            row += [""] * (width - len(row))
+
+        # Extra fields usually come from unquoted commas in the last column
+        # (e.g. "Call Bob, ext 5" in Additional Contact Info), so they are
+        # joined back onto it rather than dropped. Spreadsheet exports also pad
+        # rows with empty cells past the header, which are removed first.
+        elif len(row) > width and width:
+            while len(row) > width and (not row[-1] or row[-1].isspace()):
+                row.pop()
+            if len(row) > width:
+                row[width - 1 :] = [",".join(row[width - 1 :])]
+
+        mapped_row.update(zip(out_keys, row))
+
+        yield orjson.dumps(mapped_row)
+
+
+def _convert_segment(input_csv_filename, start, end, out_keys):
+    """
+    Converts the CSV rows between two byte offsets into a fragment of the JSON array.
+    Runs in a worker process.
+
+    The block is parsed in strict mode, so a block that ends inside a quoted field
+    is reported rather than converted into a cut-off record.
+
+    Args:
+    input_csv_filename (str): The path to the input CSV file.
+    start (int): The offset of the first byte of the segment.
+    end (int): The offset just past the last byte of the segment.
+    out_keys (list): The JSON key for each CSV column.
+
+    Returns:
+    bytes or None: The segment's records, separated by commas, or None if the block
+    does not end on a record boundary.
+    """
+    with open(input_csv_filename, "rb") as csv_file:
+        csv_file.seek(start)
+        text = csv_file.read(end - start).decode("utf-8-sig" if start == 0 else "utf-8")
+
+    # Newlines are translated the same way as the serial path's text-mode read.
+    rows = csv.reader(io.StringIO(text, newline=None), strict=True)
+    try:
+        if start == 0:
+            next(rows, None)
+        return b",\n".join(_encode_records(rows, out_keys))
+    except csv.Error:
+        return None
+
+
+def _convert_rest(input_csv_filename, start, out_keys):
+    """
+    Converts the CSV rows from a byte offset to the end of the file, the same way as
+    the serial path.
+
+    Args:
+    input_csv_filename (str): The path to the input CSV file.
+    start (int): The offset of the first byte to convert, on a record boundary.
+    out_keys (list): The JSON key for each CSV column.
+
+    Returns:
+    generator: The encoded JSON record for every non-blank row.
+    """
+    with open(input_csv_filename, "rb", buffering=_BUFFER_SIZE) as raw_file:
+        raw_file.seek(start)
+        csv_file = io.TextIOWrapper(
+            raw_file, encoding="utf-8-sig" if start == 0 else "utf-8"
+        )
+        rows = csv.reader(csv_file)
+        if start == 0:
+            next(rows, None)
+        yield from _encode_records(rows, out_keys)
+
+
+def _block_bounds(input_csv_filename, file_size, block_count):
+    """
+    Splits a CSV file into roughly equal blocks without parsing it.
+
+    Each block starts just past the first line break after an evenly spaced offset.
+    A line break can still fall inside a quoted field spanning several lines; the
+    worker converting the block before it then fails, see _convert_parallel.
+
+    Args:
+    input_csv_filename (str): The path to the input CSV file.
+    file_size (int): The size of the file in bytes.
+    block_count (int): The number of blocks to aim for.
+
+    Returns:
+    list or None: The offsets where blocks begin, followed by the end of the file,
+    or None if the file should be converted serially instead.
+    """
+    bounds = [0]
+
+    with open(input_csv_filename, "rb") as csv_file:
+        for i in range(1, block_count):
+            csv_file.seek(max(file_size * i // block_count, bounds[-1]))
+            # Lines are split on \n only, so files using bare \r line endings
+            # come back with no split points and are converted serially.
+            csv_file.readline()
+            offset = csv_file.tell()
+            if offset >= file_size:
+                break
+            if offset > bounds[-1]:
+                bounds.append(offset)
+
+    bounds.append(file_size)
+
+    if len(bounds) < 3:
+        return None
+    return bounds
 
-    data = []
 
-    with open(input_csv_filename, "r", encoding="utf-8-sig") as csv_file:
-        csv_reader = csv.DictReader(csv_file)
-        for row in csv_reader:
+def _convert_parallel(input_csv_filename, bounds, out_keys, workers):
+    """
+    Converts a large CSV file across a pool of worker processes.
+
+    Blocks are submitted a few at a time and their fragments yielded in file order,
+    so the parent holds at most two fragments per worker.
+
+    A block that fails to convert started on a record boundary, since the block
+    before it converted cleanly, while its end did not. From there the rest of the
+    file is converted serially.
+
+    Args:
+    input_csv_filename (str): The path to the input CSV file.
+    bounds (list): The block offsets from _block_bounds.
+    out_keys (list): The JSON key for each CSV column.
+    workers (int): The number of worker processes.
 
-            mapped_row = {}
+    Returns:
+    generator: The JSON array fragments, in file order.
+    """
+    blocks = zip(bounds[:-1], bounds[1:])
+    pending = deque()
+    restart = None
 
-            for key, value in row.items():
-                new_key = header_mapping.get(key, key)
-                mapped_row[new_key] = value
+    with ProcessPoolExecutor(max_workers=workers) as executor:
 
-            mapped_row.update(new_json_values)
+        def submit(count):
+            for start, end in islice(blocks, count):
+                future = executor.submit(
+                    _convert_segment, input_csv_filename, start, end, out_keys
+                )
+                pending.append((start, future))
 
-            data.append(mapped_row)
+        submit(2 * workers)
 
-        base_filename, _ = os.path.splitext(input_csv_filename)
-        output_json_filename = base_filename + ".json"
+        while pending:
+            start, future = pending.popleft()
+            fragment = future.result()
+            if fragment is None:
+                restart = start
+                for _, future in pending:
+                    future.cancel()
+                break
+            yield fragment
+            submit(1)
 
-    with open(output_json_filename, "w", encoding="utf-8") as json_file:
-        json.dump(data, json_file, indent=4, ensure_ascii=False)
+    if restart is not None:
+        yield from _convert_rest(input_csv_filename, restart, out_keys)
 
 
 def json_to_csv(input_json):
@@ -130,15 +382,23 @@ def json_to_csv(input_json):
         "errorMessage": "Error Message",
     }
 
-    with open(input_json, "r", encoding="utf-8") as json_file:
-        data = json.load(json_file)
+    data = load_json(input_json)
 
-    all_keys = set()
+    # A dict serves as an insertion-ordered set, so unmapped keys keep the
+    # order in which they first appear. Records normally share the first
+    # record's keys, which a keys-view comparison checks in C rather than
+    # key by key in Python.
+    first_keys = data[0].keys() if data else {}.keys()
+    all_keys = dict.fromkeys(first_keys)
     for entry in data:
-        all_keys.update(entry.keys())
+        if entry.keys() == first_keys:
+            continue
+        for key in entry:
+            if key not in all_keys:
+                all_keys[key] = None
 
     mapped_keys = [k for k in csv_mapping if k in all_keys]
-    unmapped_keys = [k for k in all_keys if k not in mapped_keys]
+    unmapped_keys = [k for k in all_keys if k not in csv_mapping]
 
     combined_keys = mapped_keys + unmapped_keys
 
@@ -148,14 +408,20 @@ def json_to_csv(input_json):
 
     csv_file_path = f"{base_name} - Enhanced.csv"
 
-    with open(csv_file_path, "w", newline="", encoding="utf-8-sig") as csv_file:
-        csv_writer = csv.DictWriter(csv_file, fieldnames=headers)
+    # csv.writer issues one small write per row, so the rows are collected in
+    # a large buffer before reaching the file.
+    buffered = io.BufferedWriter(
+        io.FileIO(csv_file_path, "w"), buffer_size=_WRITE_BUFFER_SIZE
+    )
 
-        csv_writer.writeheader()
+    with io.TextIOWrapper(buffered, encoding="utf-8-sig", newline="") as csv_file:
+        csv_writer = csv.writer(csv_file)
 
-        for entry in data:
-            row = {csv_mapping.get(k, k): v for k, v in entry.items()}
-            csv_writer.writerow(row)
+        csv_writer.writerow(headers)
+
+        csv_writer.writerows(
+            [entry.get(key, "") for key in combined_keys] for entry in data
+        )
 
 
 def count_records(input_csv_filename):
@@ -168,9 +434,102 @@ def count_records(input_csv_filename):
     Returns:
     None
     """
-    with open(input_csv_filename, "r", encoding="utf-8-sig") as csv_file:
-        reader = csv.reader(csv_file)
-        next(reader, None)
-        record_count = sum(1 for row in reader if any(field.strip() for field in row))
+    record_count = 0
+    fast_path = False
+
+    # An empty file cannot be memory-mapped and holds no records.
+    if os.path.getsize(input_csv_filename):
+        with open(input_csv_filename, "rb") as csv_file, mmap.mmap(
+            csv_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            # Quoted fields may contain line breaks, so lines only map
+            # one-to-one onto records when the file has no quotes at all. Files
+            # without any "\n" (old Mac line endings) are left to csv.reader
+            # too, as readline would return them as a single line.
+            fast_path = mm.find(b'"') == -1 and mm.find(b"\n") != -1
+
+            if fast_path:
+                # splitlines also breaks on a bare "\r", the same as the text
+                # mode reader used by csv_to_json.
+                lines = (
+                    part
+                    for line in iter(mm.readline, b"")
+                    for part in line.splitlines()
+                )
+                next(lines, None)
+                record_count = sum(
+                    1
+                    for line in lines
+                    if not _is_blank_row(line.decode("utf-8").split(","))
+                )
+
+    if not fast_path:
+        with open(
+            input_csv_filename, "r", encoding="utf-8-sig", buffering=_BUFFER_SIZE
+        ) as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader, None)
+            record_count = sum(1 for row in reader if not _is_blank_row(row))
 
     print(f"\nInitialization succeeded.\nThe CSV file has {record_count} rows.\n")
+
+
+def load_json(input_json):
+    """
+    Loads the records from a JSON file, adding any enrichment fields that were left out.
+
+    Args:
+    input_json (str): The path to the JSON file.
+
+    Returns:
+    list: The records stored in the file.
+    """
+    with open(input_json, "rb", buffering=_BUFFER_SIZE) as json_file:
+        data = orjson.loads(json_file.read())
+
+    if not data:
+        return data
+
+    # Records normally share the first record's columns, so a template of those
+    # columns followed by the defaults is built once and each record is copied
+    # from it, keeping the CSV columns first.
+    columns = data[0].keys()
+    template = dict.fromkeys(columns, "")
+    template.update(_DEFAULTS)
+
+    restored = []
+    for record in data:
+        if record.keys() == columns:
+            row = template.copy()
+            row.update(record)
+        else:
+            row = record
+            for key, value in _DEFAULTS.items():
+                row.setdefault(key, value)
+        restored.append(row)
+
+    return restored
+
+
+def save_json(data, output_json):
+    """
+    Writes records to a JSON file, replacing its contents.
+
+    Args:
+    data (list): The records to write.
+    output_json (str): The path to the JSON file.
+
+    Returns:
+    None
+    """
+    # The document is encoded in one piece and written straight to the file
+    # descriptor in large slices, bypassing the buffered file layer.
+    encoded = memoryview(orjson.dumps(data))
+
+    fd = os.open(output_json, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+    try:
+        while encoded:
+            written = os.write(fd, encoded[:_WRITE_BUFFER_SIZE])
+            encoded = encoded[written:]
+    finally:
+        os.close(fd)
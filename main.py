@@ -8,6 +8,7 @@ import jsonParser
 import contactSearch
 import addNewContact
 import naicsMatch
+import pipeline
 
 # Data Enrichment main file.
 
@@ -15,6 +16,8 @@ import naicsMatch
 # - Process Flow:
 #     1. Converts a CSV file into JSON format.
 #     2. Utilizes the Zoominfo API to supplement missing contact and company information.
+#        Records move through the enrichment stages in batches, with every stage
+#        running in its own thread so that their API calls overlap.
 # - Requirements: Requires an authorized Zoominfo account and the Data Enrichment Template.
 # - Output: Enriched data is saved in same directory as your input file.
 
@@ -51,13 +54,60 @@ def select_file():
     return None
 
 
+def scan_missing_contacts(entries, jwt_token, last_auth_time, username, password):
+    """
+    Pipeline stage that flags the entries still missing a contact. Needs no API access.
+
+    Returns:
+        tuple: The unchanged JWT token and last authentication time.
+    """
+
+    jsonParser.updateNeedsContact(entries)
+    return jwt_token, last_auth_time
+
+
+def enrich_records(data, jwt_token, last_auth_time, username, password):
+    """
+    Runs contact enrichment, company enrichment, the missing contact scan, contact search
+    and new contact updates over the records in data, which are updated in place.
+
+    The stages overlap as a batch pipeline, see pipeline.run_pipeline.
+
+    Args:
+        data (list): The records to enrich.
+        jwt_token (str): The JWT token for authentication.
+        last_auth_time (float): The timestamp of the last authentication.
+        username (str): The username for authentication.
+        password (str): The password for authentication.
+
+    Returns:
+        None
+    """
+
+    stages = [
+        contactEnrich.contact_enrich,
+        companyEnrich.company_enrich,
+        scan_missing_contacts,
+        contactSearch.contact_search,
+        addNewContact.add_new_contact,
+    ]
+
+    pipeline.run_pipeline(
+        data,
+        stages,
+        contactEnrich.BATCH_SIZE,
+        (jwt_token, last_auth_time, username, password),
+    )
+
+
 def main():
     """
     Runs the Data Enrichment Tool, which enriches a CSV file with additional data using the ZoomInfo API.
     The user is prompted to enter their ZoomInfo credentials, select a CSV file, and then the program performs
-    contact and company enrichment using the ZoomInfo API. The program then scans for missing contacts, searches
-    for contact IDs, updates missing contacts, and updates the addresses in the CSV file. Finally, the program
-    converts the enriched JSON file back to CSV format and saves it to disk.
+    contact and company enrichment using the ZoomInfo API, scans for missing contacts, searches for contact IDs
+    and updates missing contacts, with these stages overlapping in a pipeline. The program then updates the
+    addresses in the CSV file. Finally, the program converts the enriched JSON file back to CSV format and
+    saves it to disk.
     """
 
     # Welcome message
@@ -83,42 +133,27 @@ def main():
     input_json = input_csv.rsplit(".", 1)[0] + ".json"
     print("Conversion complete.")
 
-    jsonParser.remove_spaces(input_json)
+    # The records stay in memory between stages and are written back once.
+    data = fileConvert.load_json(input_json)
+    jsonParser.remove_spaces(data)
 
     print("Requesting new security token...")
     jwt_token = auth.authenticate(username, password)
     last_auth_time = time.time()
 
-    print("Beginning contact enrichment...")
-    jwt_token, last_auth_time = contactEnrich.contact_enrich(
-        input_json, jwt_token, last_auth_time, username, password
-    )
-    print("\nContact enrichment complete.\nBeginning company enrichment...")
+    print("Beginning enrichment...")
+    enrich_records(data, jwt_token, last_auth_time, username, password)
 
-    jwt_token, last_auth_time = companyEnrich.company_enrich(
-        input_json, jwt_token, last_auth_time, username, password
-    )
-
-    print("\nCompany enrichment complete.")
-
-    print("Scanning for missing Contacts...")
-    jsonParser.updateNeedsContact(input_json)
-
-    print("Returning Contact IDs...")
-    jwt_token, last_auth_time = contactSearch.contact_search(
-        input_json, jwt_token, last_auth_time, username, password
-    )
-
-    print("Updating Missing Contacts...")
-    jwt_token, last_auth_time = addNewContact.add_new_contact(
-        input_json, jwt_token, last_auth_time, username, password
-    )
-    print("\nContact updates complete.")
+    missing_contacts = sum(1 for entry in data if entry["needsContact"] == "Yes")
+    contacts_found = sum(1 for entry in data if entry["newContactFound"] == "Yes")
+    print(f"\nEnrichment complete.\n{missing_contacts} missing contacts found.")
+    print(f"Total contact's found: {contacts_found}")
 
-    # Update the addresses in the JSON file
+    # Update the addresses of the records
     print("Preparing new CSV file...")
-    naicsMatch.get_sector_and_industry(input_json)
-    jsonParser.update_address(input_json)
+    naicsMatch.get_sector_and_industry(data)
+    jsonParser.update_address(data)
+    fileConvert.save_json(data, input_json)
 
     # Convert the JSON file back to CSV format
     fileConvert.json_to_csv(input_json)
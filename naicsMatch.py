@@ -1,29 +1,20 @@
-import json
-
-
-def get_sector_and_industry(input_filename):
+def get_sector_and_industry(data):
     """
     Updates records with sector and industry titles using NAICS codes.
 
     Args:
-        input_filename (str): The path of the input file.
+        data (list): The records to update in place.
 
     Returns:
         None
     """
 
-    with open(input_filename, "r", encoding="utf-8") as file:
-        data = json.load(file)
-
     for record in data:
         if record["zi_c_naics6"] != "":
             naics6 = record["zi_c_naics6"]
             record["sectorTitle"] = sector_dict.get(int(naics6[:2]), "Unknown")
             record["primaryIndustry"] = industry_dict.get(int(naics6), "Unknown")
 
-    with open(input_filename, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=4, ensure_ascii=False)
-
 
 sector_title = [
     (11, "Agriculture, Forestry, Fishing and Hunting"),
@@ -0,0 +1,94 @@
+import queue
+import threading
+
+# Batch pipeline used by main.py to run the enrichment stages.
+
+# - Each stage runs in its own thread and hands finished batches to the next
+#   stage through a queue, so the API calls of different stages overlap.
+# - If any stage raises, every stage stops taking new batches and the
+#   exception is re-raised once the threads have finished.
+
+
+def run_stage(stage, inbox, outbox, credentials, errors, stop):
+    """
+    Runs one enrichment stage, passing every batch from inbox through the stage and on to outbox.
+    Each stage holds its own JWT token and re-authenticates when it expires.
+
+    Args:
+        stage (callable): The stage function, called with a batch and the authentication state.
+        inbox (queue.Queue): The batches to process, terminated by None.
+        outbox (queue.Queue): The queue feeding the next stage.
+        credentials (tuple): The JWT token, last authentication time, username and password.
+        errors (list): Collects any exception raised by the stage.
+        stop (threading.Event): Set when any stage fails, so the others stop taking batches.
+    """
+
+    jwt_token, last_auth_time, username, password = credentials
+
+    try:
+        while True:
+            batch = inbox.get()
+            if batch is None or stop.is_set():
+                break
+            jwt_token, last_auth_time = stage(
+                batch, jwt_token, last_auth_time, username, password
+            )
+            outbox.put(batch)
+    except Exception as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        outbox.put(None)
+
+
+def run_pipeline(data, stages, batch_size, credentials):
+    """
+    Runs the records in data through each stage in turn, updating them in place.
+
+    The records are split into batches and each stage runs in its own thread, so a batch
+    can be in a later stage while the following batches are still in earlier ones.
+
+    Args:
+        data (list): The records to process.
+        stages (list): The stage functions, in order.
+        batch_size (int): The number of records in each batch.
+        credentials (tuple): The JWT token, last authentication time, username and password.
+
+    Returns:
+        None
+    """
+
+    queues = [queue.Queue() for _ in range(len(stages) + 1)]
+    errors = []
+    stop = threading.Event()
+
+    threads = [
+        threading.Thread(
+            target=run_stage,
+            args=(stage, queues[i], queues[i + 1], credentials, errors, stop),
+            daemon=True,
+        )
+        for i, stage in enumerate(stages)
+    ]
+    for thread in threads:
+        thread.start()
+
+    for start in range(0, len(data), batch_size):
+        queues[0].put(data[start : start + batch_size])
+    queues[0].put(None)
+
+    records_processed = 0
+    while True:
+        batch = queues[-1].get()
+        if batch is None:
+            break
+        records_processed += len(batch)
+        print(
+            f"\rRecords enriched: {records_processed}/{len(data)}", end="", flush=True
+        )
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
@@ -0,0 +1,109 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fileConvert
+
+HEADER = [
+    "Supplier Company",
+    "Supplier Street",
+    "Supplier City",
+    "Supplier State",
+    "Supplier Zip Code",
+    "Supplier Country",
+    "Supplier First Name",
+    "Supplier Last Name",
+    "Supplier Email",
+    "Supplier Phone",
+    "Site Name",
+    "Site ID",
+    "Additional Contact Info",
+]
+
+
+def build_rows(eol):
+    """
+    Template-shaped rows with a literal quote in an unquoted field, multi-line quoted
+    notes, overflow fields and blank rows.
+    """
+    rows = [",".join(HEADER)]
+    for i in range(600):
+        if i == 5:
+            rows.append('Acme 12" Screens,' + ",".join(["x"] * 12))
+        elif i % 10 == 1:
+            rows.append(f'"Note {i}{eol}second line",' + ",".join(["y"] * 12))
+        elif i % 10 == 4:
+            rows.append(f"Co {i}," + ",".join(["z"] * 11) + ",Call Bob, ext 5,,")
+        elif i % 10 == 7:
+            rows.append(",,,,")
+        else:
+            rows.append(f"Co {i}," + ",".join([str(i)] * 12))
+    return rows
+
+
+class CsvToJsonParallelTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write_csv(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8-sig", newline="") as csv_file:
+            csv_file.write(text)
+        return path
+
+    def convert(self, path, parallel):
+        min_size = 0 if parallel else 1 << 40
+        with mock.patch.object(
+            fileConvert, "_PARALLEL_MIN_SIZE", min_size
+        ), mock.patch.object(
+            fileConvert, "_PARALLEL_BLOCK_SIZE", 2048
+        ), mock.patch.object(
+            fileConvert.os, "cpu_count", return_value=4
+        ):
+            fileConvert.csv_to_json(path)
+        with open(os.path.splitext(path)[0] + ".json", "rb") as json_file:
+            return json_file.read()
+
+    def assert_same_output(self, path):
+        serial = self.convert(path, parallel=False)
+        parallel = self.convert(path, parallel=True)
+        self.assertEqual(serial, parallel)
+        return serial
+
+    def test_lf(self):
+        path = self.write_csv("lf.csv", "\n".join(build_rows("\n")) + "\n")
+        with mock.patch.object(
+            fileConvert, "_convert_parallel", wraps=fileConvert._convert_parallel
+        ) as convert_parallel:
+            output = self.assert_same_output(path)
+        convert_parallel.assert_called_once()
+        self.assertIn(b'"companyName":"Acme 12\\" Screens"', output)
+        self.assertIn(b'"companyName":"Note 1\\nsecond line"', output)
+        self.assertIn(b'"additionalContactInfo":"Call Bob, ext 5"', output)
+
+    def test_crlf(self):
+        path = self.write_csv("crlf.csv", "\r\n".join(build_rows("\r\n")) + "\r\n")
+        self.assert_same_output(path)
+
+    def test_cr_only(self):
+        path = self.write_csv("cr.csv", "\r".join(build_rows("\r")) + "\r")
+        self.assert_same_output(path)
+
+    def test_block_cut_inside_quoted_field(self):
+        rows = build_rows("\n")
+        rows[300] = '"' + "\n".join(["long note"] * 2000) + '",' + ",".join(["q"] * 12)
+        path = self.write_csv("quoted.csv", "\n".join(rows) + "\n")
+        with mock.patch.object(
+            fileConvert, "_convert_rest", wraps=fileConvert._convert_rest
+        ) as convert_rest:
+            self.assert_same_output(path)
+        convert_rest.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pipeline
+
+
+class RunPipelineTest(unittest.TestCase):
+    def test_upstream_stages_stop_after_a_failure(self):
+        failed = threading.Event()
+        processed = []
+
+        def upstream(batch, jwt_token, last_auth_time, username, password):
+            processed.append(batch)
+            # Hold the later batches back until the failing stage has run.
+            if len(processed) > 1:
+                failed.wait(timeout=5)
+                time.sleep(0.01)
+            return jwt_token, last_auth_time
+
+        def failing(batch, jwt_token, last_auth_time, username, password):
+            failed.set()
+            raise ConnectionError("API unavailable")
+
+        data = [{"id": i} for i in range(1000)]
+
+        with self.assertRaises(ConnectionError):
+            pipeline.run_pipeline(
+                data, [upstream, failing], 10, ("token", 0.0, "user", "password")
+            )
+
+        self.assertLess(len(processed), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()